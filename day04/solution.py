@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 
 import logging
-import copy
 import os
+from collections import deque
+
+import numpy as np
 
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1),
+              (0, -1),          (0, 1),
+              (1, -1),  (1, 0), (1, 1)]
+
+# below this fraction of occupied cells the floor is held as a set of roll coordinates
+SPARSE_DENSITY = 0.05
+
 def get_file_data(fn='input.txt'):
     """Read the input file and return its contents as a string."""
     with open(fn, encoding='utf-8') as f:
@@ -18,44 +27,142 @@ def parse_data(text_data):
     parsed_data = [[0 if x == '.' else 1 for x in line] for line in text_data.strip('\n ').split('\n')]
     return parsed_data
 
+def parse_roll_coordinates(text_data):
+    """Parse the grid into a set of (r, c) coordinates of occupied cells."""
+    lines = text_data.strip('\n ').split('\n')
+    return {(r, c) for r, line in enumerate(lines) for c, x in enumerate(line) if x != '.'}
+
+def parse_data_auto(text_data, density_threshold=SPARSE_DENSITY):
+    """Parse into a coordinate set for mostly-empty floors, otherwise into the dense grid."""
+    lines = text_data.strip('\n ').split('\n')
+    cells = sum(len(line) for line in lines)
+    occupied = cells - sum(line.count('.') for line in lines)
+    if cells and occupied / cells < density_threshold:
+        logger.debug(msg=f"Using sparse floor for {occupied} rolls in {cells} cells")
+        return parse_roll_coordinates(text_data)
+    return parse_data(text_data)
+
+def encode_rolls(rolls):
+    """Encode (r, c) coordinates as single ints r * stride + c so neighbor shifts become offsets."""
+    # columns shift by one so c - 1 never wraps into the previous row
+    stride = max((c for _, c in rolls), default=0) + 3
+    offsets = [dr * stride + dc for dr, dc in DIRECTIONS]
+    return {r * stride + c + 1 for r, c in rolls}, offsets
+
+def count_sparse_neighbors(rolls):
+    """Count the occupied neighbors of every roll in a coordinate set by shifting coordinates."""
+    encoded, offsets = encode_rolls(rolls)
+    return {key: sum(key + offset in encoded for offset in offsets) for key in encoded}, offsets
+
+def peel_sparse_rolls(rolls):
+    """Remove accessible rolls from a coordinate set until none remain, returning how many were removed."""
+    counts, offsets = count_sparse_neighbors(rolls)
+    queue = deque(key for key, count in counts.items() if count < 4)
+    queued = set(queue)
+    while queue:
+        key = queue.popleft()
+        del counts[key]
+        for offset in offsets:
+            neighbor = key + offset
+            if neighbor in counts:
+                counts[neighbor] -= 1
+                if counts[neighbor] < 4 and neighbor not in queued:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+    return len(queued)
+
+def parse_packed_rows(text_data):
+    """Parse the grid into one int bitmask per row, with column c stored in bit c."""
+    lines = text_data.strip('\n ').split('\n')
+    table = str.maketrans('.@', '01')
+    packed_rows = [int(line.translate(table)[::-1], 2) for line in lines]
+    return packed_rows, len(lines[0])
+
+def get_packed_accessible(packed_rows, width):
+    """Return per-row bitmasks of rolls with fewer than 4 neighbors using bit-sliced adders."""
+    mask = (1 << width) - 1
+    accessible = []
+    for r, row in enumerate(packed_rows):
+        above = packed_rows[r - 1] if r > 0 else 0
+        below = packed_rows[r + 1] if r + 1 < len(packed_rows) else 0
+        neighbors = (above << 1, above, above >> 1, row << 1, row >> 1, below << 1, below, below >> 1)
+        # two low count bits plus a sticky bit that sets once the count reaches 4
+        bit0 = bit1 = at_least_4 = 0
+        for plane in neighbors:
+            carry0 = bit0 & plane
+            bit0 ^= plane
+            carry1 = bit1 & carry0
+            bit1 ^= carry0
+            at_least_4 |= carry1
+        accessible.append(row & ~at_least_4 & mask)
+    return accessible
+
+def get_part1_packed_solution(packed_rows, width):
+    """Part 1 solution over bit-packed rows."""
+    return sum(row.bit_count() for row in get_packed_accessible(packed_rows, width))
+
+def get_part2_packed_solution(packed_rows, width):
+    """Part 2 solution over bit-packed rows, removing each wave of accessible rolls at once."""
+    initial_rolls = sum(row.bit_count() for row in packed_rows)
+    while True:
+        accessible = get_packed_accessible(packed_rows, width)
+        if not any(accessible):
+            break
+        packed_rows = [row & ~gone for row, gone in zip(packed_rows, accessible)]
+    return initial_rolls - sum(row.bit_count() for row in packed_rows)
+
 def count_neighbors(r, c, data):
     """Check the neighbors of a cell at (r, c) in the data grid."""
-    directions = [(-1, -1), (-1, 0), (-1, 1),
-                  (0, -1),          (0, 1),
-                  (1, -1),  (1, 0), (1, 1)]
     count = 0
-    for dr, dc in directions:
+    for dr, dc in DIRECTIONS:
         nr, nc = r + dr, c + dc
         if 0 <= nr < len(data) and 0 <= nc < len(data[0]):
             count += data[nr][nc]
     return count
 
+def count_all_neighbors(grid):
+    """Count the occupied neighbors of every cell at once with a padded 3x3 window sum."""
+    rows, cols = grid.shape
+    padded = np.pad(grid, 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr, dc in DIRECTIONS:
+        counts += padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+    return counts
+
 def get_part1_solution(parsed_data):
     """Complete Part 1 solution here"""
-    accessible_rolls = 0
-    for r, row in enumerate(parsed_data):
-        for c, value in enumerate(row):
-            if value == 1 and count_neighbors(r, c, parsed_data) < 4:
-                accessible_rolls += 1
-                # logger.debug(msg=f"Accessible roll at ({r}, {c})")
-    return accessible_rolls
+    if isinstance(parsed_data, (set, frozenset)):
+        counts, _ = count_sparse_neighbors(parsed_data)
+        return sum(1 for count in counts.values() if count < 4)
+    grid = np.array(parsed_data, dtype=np.uint8)
+    accessible = (grid == 1) & (count_all_neighbors(grid) < 4)
+    return int(np.count_nonzero(accessible))
 
 def get_part2_solution(parsed_data):
     """Complete Part 2 solution here"""
-    data = copy.deepcopy(parsed_data)
-    initial_rolls = sum([sum(x) for x in data])
-    while True:
-        accessible_rolls = 0
-        for r, row in enumerate(data):
-            for c, value in enumerate(row):
-                if value == 1 and count_neighbors(r, c, data) < 4:
-                    accessible_rolls += 1
-                    data[r][c] = 0  # Mark as accessed
-
-        if accessible_rolls == 0:
-            break
-    final_rolls = sum([sum(x) for x in data])
-    return initial_rolls - final_rolls
+    if isinstance(parsed_data, (set, frozenset)):
+        return peel_sparse_rolls(parsed_data)
+    grid = np.array(parsed_data, dtype=np.uint8)
+    rows, cols = grid.shape
+    counts = count_all_neighbors(grid).tolist()
+    data = grid.tolist()
+
+    # peel rolls like a k-core: each removal only decrements its neighbors' counts
+    queue = deque((r, c) for r in range(rows) for c in range(cols) if data[r][c] == 1 and counts[r][c] < 4)
+    queued = set(queue)
+    removed_rolls = 0
+    while queue:
+        r, c = queue.popleft()
+        data[r][c] = 0  # Mark as accessed
+        removed_rolls += 1
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and data[nr][nc] == 1:
+                counts[nr][nc] -= 1
+                if counts[nr][nc] < 4 and (nr, nc) not in queued:
+                    queued.add((nr, nc))
+                    queue.append((nr, nc))
+    return removed_rolls
 
 def print_answer(answer, part=1):
     """Print the answer in a standard format."""
@@ -68,7 +175,7 @@ def print_answer(answer, part=1):
 def main():
     """Main function to run the solution."""
     data = get_file_data()
-    parsed_data = parse_data(data)
+    parsed_data = parse_data_auto(data)
     answer = get_part1_solution(parsed_data)
     print_answer(answer, part=1)
     answer = get_part2_solution(parsed_data)
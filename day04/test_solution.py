@@ -1,7 +1,11 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
+import numpy as np
 import pytest
 from .solution import parse_data, get_file_data, get_part1_solution, get_part2_solution
+from .solution import count_neighbors, count_all_neighbors
+from .solution import parse_packed_rows, get_part1_packed_solution, get_part2_packed_solution
+from .solution import parse_roll_coordinates, parse_data_auto
 
 
 @pytest.fixture(name="test_data")
@@ -51,3 +55,46 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_part1_solution(data) == 13
     assert get_part2_solution(data) == 43
+
+
+def test_count_all_neighbors(test_data):
+    """Test vectorized neighbor counts against the per-cell count
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    counts = count_all_neighbors(np.array(data, dtype=np.uint8))
+    for r, row in enumerate(data):
+        for c, _ in enumerate(row):
+            assert counts[r, c] == count_neighbors(r, c, data)
+
+
+def test_packed_rows(test_data):
+    """Test bit-packed rows and bit-sliced neighbor thresholds
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    packed_rows, width = parse_packed_rows(test_data)
+    assert width == 10
+    assert packed_rows[0] == 0b0111101100
+    assert get_part1_packed_solution(packed_rows, width) == 13
+    assert get_part2_packed_solution(packed_rows, width) == 43
+
+
+def test_sparse_floor(test_data):
+    """Test the coordinate-set mode and automatic density selection
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    rolls = parse_roll_coordinates(test_data)
+    assert len(rolls) == 71
+    assert (0, 2) in rolls and (0, 0) not in rolls
+    assert get_part1_solution(rolls) == 13
+    assert get_part2_solution(rolls) == 43
+    assert isinstance(parse_data_auto(test_data), list)
+    assert parse_data_auto(test_data, density_threshold=0.8) == rolls
+    sparse_text = '\n'.join(['.' * 40] * 20 + ['..@@@' + '.' * 35])
+    assert parse_data_auto(sparse_text) == {(20, 2), (20, 3), (20, 4)}
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
-import copy
 import logging
 import os
+import sys
+from bisect import bisect_left, bisect_right
+
+import numpy as np
 
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
@@ -20,15 +23,46 @@ def parse_data(text_data):
     ingredients = [int(x) for x in ingredients_text.strip('\n ').split('\n')]
     return ranges, ingredients
 
-def get_part1_solution(ranges, ingredients):
-    """Complete Part 1 solution here"""
-    total_fresh = 0
-    for ingredient in ingredients:
-        for r in ranges:
-            if r[0] <= ingredient <= r[1]:
-                total_fresh += 1
+def parse_ingredient_array(text_data):
+    """Parse only the ingredient section straight into an int64 array."""
+    _, ingredients_text = text_data.strip('\n ').split('\n\n')
+    return np.fromstring(ingredients_text, dtype=np.int64, sep='\n')
+
+def read_range_section(lines):
+    """Consume range lines from an iterator up to the blank separator line."""
+    ranges = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if ranges:
                 break
-    return total_fresh
+            continue
+        ranges.append([int(num) for num in line.split('-')])
+    return ranges
+
+def iter_fresh_ingredients(lines):
+    """Stream (ingredient, is_fresh) pairs from an iterator of input lines without holding the ingredients."""
+    lines = iter(lines)
+    index = build_interval_index(read_range_section(lines))
+    for line in lines:
+        line = line.strip()
+        if line:
+            ingredient = int(line)
+            yield ingredient, is_fresh(index, ingredient)
+
+def get_part1_stream_solution(fn='input.txt'):
+    """Part 1 solution streamed line by line from a file, or from stdin when fn is '-'."""
+    if fn == '-':
+        return sum(fresh for _, fresh in iter_fresh_ingredients(sys.stdin))
+    with open(fn, encoding='utf-8') as f:
+        return sum(fresh for _, fresh in iter_fresh_ingredients(f))
+
+def get_part1_solution(ranges, ingredients, batch=False):
+    """Complete Part 1 solution here"""
+    index = build_interval_index(ranges)
+    if batch:
+        return count_fresh_sorted(index, ingredients)
+    return sum(1 for ingredient in ingredients if is_fresh(index, ingredient))
 
 def merge_ranges(ranges):
     """Merge overlapping ranges into a list of non-overlapping ranges."""
@@ -36,11 +70,99 @@ def merge_ranges(ranges):
     merged = []
     for current in sorted_ranges:
         if not merged or merged[-1][1] < current[0] - 1:
-            merged.append(current)
+            merged.append(list(current))
         else:
             merged[-1][1] = max(merged[-1][1], current[1])
     return merged
 
+def build_interval_index(ranges):
+    """Build parallel sorted lists of merged range starts and ends for binary search."""
+    merged = merge_ranges(ranges)
+    starts = [r[0] for r in merged]
+    ends = [r[1] for r in merged]
+    return starts, ends
+
+def is_fresh(index, ingredient):
+    """Check whether an ingredient falls in any range using a binary search over the index."""
+    starts, ends = index
+    i = bisect_right(starts, ingredient) - 1
+    return i >= 0 and ingredient <= ends[i]
+
+def count_fresh_sorted(index, ingredients):
+    """Count fresh ingredients by sorting them and walking the index once alongside."""
+    starts, ends = index
+    total_fresh = 0
+    i = 0
+    for ingredient in sorted(ingredients):
+        while i < len(ends) and ends[i] < ingredient:
+            i += 1
+        if i == len(ends):
+            break
+        if starts[i] <= ingredient:
+            total_fresh += 1
+    return total_fresh
+
+def classify_ingredient_array(index, ingredient_ids, return_mask=False):
+    """Count fresh ingredients in an int64 array with searchsorted, optionally returning the fresh mask."""
+    starts = np.asarray(index[0], dtype=np.int64)
+    ends = np.asarray(index[1], dtype=np.int64)
+    if len(starts) == 0:
+        # no fresh ranges at all, so there is no end to look up
+        mask = np.zeros(np.shape(ingredient_ids), dtype=bool)
+        return (0, mask) if return_mask else 0
+    positions = np.searchsorted(starts, ingredient_ids, side='right') - 1
+    mask = (positions >= 0) & (ingredient_ids <= ends[np.maximum(positions, 0)])
+    total_fresh = int(np.count_nonzero(mask))
+    if return_mask:
+        return total_fresh, mask
+    return total_fresh
+
+class FreshIntervalSet:
+    """Merged freshness ranges kept sorted under range inserts and removals."""
+
+    def __init__(self, ranges=()):
+        starts, ends = build_interval_index(ranges)
+        self.starts = starts
+        self.ends = ends
+        self.total_fresh = sum(end - start + 1 for start, end in zip(starts, ends))
+
+    def __contains__(self, ingredient):
+        return is_fresh((self.starts, self.ends), ingredient)
+
+    def get_ranges(self):
+        """Return the merged ranges as [start, end] pairs."""
+        return [[start, end] for start, end in zip(self.starts, self.ends)]
+
+    def add(self, start, end):
+        """Mark every ingredient from start to end as fresh, merging overlapping and adjacent ranges."""
+        lo = bisect_left(self.ends, start - 1)
+        hi = bisect_right(self.starts, end + 1)
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.total_fresh -= sum(e - s + 1 for s, e in zip(self.starts[lo:hi], self.ends[lo:hi]))
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+        self.total_fresh += end - start + 1
+
+    def remove(self, start, end):
+        """Mark every ingredient from start to end as spoiled, trimming or splitting the ranges it touches."""
+        lo = bisect_left(self.ends, start)
+        hi = bisect_right(self.starts, end)
+        if lo >= hi:
+            return
+        new_starts, new_ends = [], []
+        if self.starts[lo] < start:
+            new_starts.append(self.starts[lo])
+            new_ends.append(start - 1)
+        if self.ends[hi - 1] > end:
+            new_starts.append(end + 1)
+            new_ends.append(self.ends[hi - 1])
+        self.total_fresh -= sum(e - s + 1 for s, e in zip(self.starts[lo:hi], self.ends[lo:hi]))
+        self.total_fresh += sum(e - s + 1 for s, e in zip(new_starts, new_ends))
+        self.starts[lo:hi] = new_starts
+        self.ends[lo:hi] = new_ends
+
 def get_part2_solution(ranges):
     """Complete Part 2 solution here"""
     merged_ranges = merge_ranges(ranges)
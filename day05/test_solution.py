@@ -1,7 +1,12 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
+import numpy as np
 import pytest
 from .solution import parse_data, get_file_data, get_part1_solution, get_part2_solution
+from .solution import build_interval_index, is_fresh, count_fresh_sorted
+from .solution import parse_ingredient_array, classify_ingredient_array
+from .solution import FreshIntervalSet
+from .solution import read_range_section, iter_fresh_ingredients, get_part1_stream_solution
 
 
 @pytest.fixture(name="test_data")
@@ -52,4 +57,83 @@ def test_all(test_data):
     """
     ranges, ingredients = parse_data(test_data)
     assert get_part1_solution(ranges, ingredients) == 3
-    assert get_part2_solution(ranges) == 14
\ No newline at end of file
+    assert get_part2_solution(ranges) == 14
+
+def test_interval_index(test_data):
+    """Test binary search and merge-walk freshness lookups
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    ranges, ingredients = parse_data(test_data)
+    index = build_interval_index(ranges)
+    assert index == ([3, 10], [5, 20])
+    assert [is_fresh(index, x) for x in ingredients] == [False, True, False, True, True, False]
+    assert count_fresh_sorted(index, ingredients) == 3
+    assert get_part1_solution(ranges, ingredients, batch=True) == 3
+    # merging must leave the caller's ranges untouched
+    assert ranges[2] == [16, 20]
+
+
+def test_ingredient_array(test_data):
+    """Test searchsorted classification of an int64 ingredient array
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    ranges, _ = parse_data(test_data)
+    ingredient_ids = parse_ingredient_array(test_data)
+    assert ingredient_ids.dtype == np.int64
+    assert ingredient_ids.tolist() == [1, 5, 8, 11, 17, 32]
+    index = build_interval_index(ranges)
+    assert classify_ingredient_array(index, ingredient_ids) == 3
+    total_fresh, mask = classify_ingredient_array(index, ingredient_ids, return_mask=True)
+    assert total_fresh == 3
+    assert mask.tolist() == [False, True, False, True, True, False]
+
+
+def test_fresh_interval_set(test_data):
+    """Test incremental range inserts and removals against the batch totals
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    ranges, _ = parse_data(test_data)
+    fresh = FreshIntervalSet(ranges)
+    assert fresh.total_fresh == get_part2_solution(ranges)
+    fresh.remove(12, 13)
+    assert fresh.get_ranges() == [[3, 5], [10, 11], [14, 20]]
+    assert 12 not in fresh and 14 in fresh
+    fresh.add(6, 9)
+    assert fresh.get_ranges() == [[3, 11], [14, 20]]
+    assert fresh.total_fresh == 16
+
+
+def test_streaming_parser(test_data):
+    """Test line-by-line range and ingredient streaming
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    lines = iter(test_data.split('\n'))
+    assert read_range_section(lines) == [[3, 5], [10, 14], [16, 20], [12, 18]]
+    assert next(lines) == '1'
+    fresh = list(iter_fresh_ingredients(test_data.split('\n')))
+    assert fresh[:2] == [(1, False), (5, True)]
+    test_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test.txt")
+    assert get_part1_stream_solution(test_file) == 3
+
+
+def test_ingredient_array_no_ranges(test_data):
+    """Test array classification against an empty interval index
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    ingredient_ids = parse_ingredient_array(test_data)
+    index = build_interval_index([])
+    assert classify_ingredient_array(index, ingredient_ids) == 0
+    total_fresh, mask = classify_ingredient_array(index, ingredient_ids, return_mask=True)
+    assert total_fresh == 0
+    assert mask.dtype == bool
+    assert mask.tolist() == [False] * 6
@@ -20,30 +20,25 @@ def parse_data(text_data):
     number_lists = list(zip(*number_rows))
     return number_lists, operators
 
-def check_empty_column(num_lines, index):
-    """Check if a given column index is empty across all lines."""
-    for line in num_lines:
-        if line[index] != ' ':
-            return False
-    return True
-
 def parse_data2(text_data):
     """Alternative parsing function if needed for Part 2."""
     lines = text_data.strip('\n').split('\n')
     operator_line = lines[-1]
-    num_lines = lines[:-1]
+    width = max(len(line) for line in lines)
+    operators = [char for char in operator_line if char in '+*']
+
+    # transpose once: each column of digits reads top to bottom as one number, blank columns separate problems
     number_lists = []
-    operators = []
     nums = []
-    for i, char in enumerate(operator_line):
-        if char in '+*':
-            operators.append(char)
-        if not check_empty_column(num_lines, i):
-            num = int(''.join([line[i] for line in num_lines if line[i] != ' ']))
-            nums.append(num)
-        if check_empty_column(num_lines, i) or i == len(operator_line) - 1:
+    for column in zip(*(line.ljust(width) for line in lines[:-1])):
+        digits = ''.join(column).replace(' ', '')
+        if digits:
+            nums.append(int(digits))
+        elif nums:
             number_lists.append(nums)
             nums = []
+    if nums:
+        number_lists.append(nums)
 
     return number_lists, operators
 
@@ -50,3 +50,16 @@ def test_all(test_data):
     assert get_part1_solution(*data) == 4277556
     data = parse_data2(test_data)
     assert get_part1_solution(*data) == 3263827
+
+
+def test_parse_columns(test_data):
+    """Test the columnar Part 2 parser
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    number_lists, operators = parse_data2(test_data)
+    assert number_lists == [[1, 24, 356], [369, 248, 8], [32, 581, 175], [623, 431, 4]]
+    assert operators == ['*', '+', '*', '+']
+    # ragged lines are padded so short rows read as blanks
+    assert parse_data2("12\n3\n+ ") == ([[13, 2]], ['+'])
@@ -3,9 +3,16 @@
 import logging
 import os
 
+import numpy as np
+
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# maps '^' to '1' and every other byte to '0' for building row bitmasks
+SPLITTER_TABLE = bytes(ord('1') if b == ord('^') else ord('0') for b in range(256))
+
+MAX_SAFE_COUNT = np.iinfo(np.int64).max // 3
+
 def get_file_data(fn='input.txt'):
     """Read the input file and return its contents as a string."""
     with open(fn, encoding='utf-8') as f:
@@ -17,48 +24,100 @@ def parse_data(text_data):
     parsed_data = [list(line) for line in text_data.strip('\n ').split('\n')]
     return parsed_data
 
-def get_part1_solution(parsed_data):
-    """Complete Part 1 solution here"""
-    beam_cols = set()
-    beam_cols.add(parsed_data[0].index('S'))
+def get_row_mask(row):
+    """Return a bitmask of the splitter columns in a row, with column c stored in bit c."""
+    return int(''.join(row)[::-1].encode('utf-8').translate(SPLITTER_TABLE), 2)
+
+def propagate_beams(beams, splitters, width_mask):
+    """Advance the beam bitmask through one row of splitters, returning the new beams and split count."""
+    hits = beams & splitters
+    beams = ((beams & ~splitters) | (hits << 1) | (hits >> 1)) & width_mask
+    return beams, hits.bit_count()
+
+def iter_manifold_rows(fn='input.txt'):
+    """Yield manifold rows one at a time straight from the file."""
+    with open(fn, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line.strip():
+                yield line
+
+def count_beam_splits(rows):
+    """Count beam splits over an iterable of rows, holding only the current row and beam state."""
+    rows = iter(rows)
+    first_row = next(rows)
+    beams = 1 << first_row.index('S')
+    width_mask = (1 << len(first_row)) - 1
     splits = 0
-    for _, row in enumerate(parsed_data[1:]):
-        next_beam_cols = beam_cols.copy()
-        for c in beam_cols:
-            if row[c] == '^':
-                splits += 1
-                if c - 1 >= 0:
-                    next_beam_cols.add(c - 1)
-                if c + 1 < len(row):
-                    next_beam_cols.add(c + 1)
-                next_beam_cols.remove(c)
-        beam_cols = next_beam_cols
+    for row in rows:
+        beams, row_splits = propagate_beams(beams, get_row_mask(row), width_mask)
+        splits += row_splits
     return splits
 
+def get_part1_solution(parsed_data):
+    """Complete Part 1 solution here"""
+    return count_beam_splits(parsed_data)
+
+def get_part1_stream_solution(fn='input.txt'):
+    """Part 1 solution streamed row by row from the file."""
+    return count_beam_splits(iter_manifold_rows(fn))
+
+def get_splitter_array(row):
+    """Return a boolean array marking the splitter columns in a row."""
+    return np.frombuffer(''.join(row).encode('utf-8'), dtype=np.uint8) == ord('^')
+
+def propagate_timelines(counts, splitters):
+    """Advance per-column timeline counts through one row of splitters as shifted vector additions."""
+    # a row at most triples the largest count, so switch to python ints before int64 could overflow
+    if counts.dtype != object and counts.max() > MAX_SAFE_COUNT:
+        logger.debug(msg="Promoting timeline counts to arbitrary precision")
+        counts = counts.astype(object)
+    hits = np.where(splitters, counts, 0).astype(counts.dtype)
+    next_counts = counts - hits
+    next_counts[1:] += hits[:-1]
+    next_counts[:-1] += hits[1:]
+    return next_counts
+
+def sum_timelines(counts):
+    """Total the per-column timeline counts exactly, since the sum can pass int64 even when no column does."""
+    return sum(counts.tolist())
+
+def count_timelines(rows):
+    """Count timelines over an iterable of rows, holding only the current row and column counts."""
+    rows = iter(rows)
+    first_row = next(rows)
+    counts = np.zeros(len(first_row), dtype=np.int64)
+    counts[first_row.index('S')] = 1
+    for row in rows:
+        counts = propagate_timelines(counts, get_splitter_array(row))
+    timelines = sum_timelines(counts)
+    return timelines
+
 def get_part2_solution(parsed_data):
     """Complete Part 2 solution here"""
-    starter_index = parsed_data[0].index('S')
-    beam_cols = {starter_index: 1}
-    for _, row in enumerate(parsed_data[1:]):
-        next_beam_cols = {}
-        for c, n in beam_cols.items():
-            if row[c] == '^':
-                if c - 1 in next_beam_cols:
-                    next_beam_cols[c - 1] += n
-                else:
-                    next_beam_cols[c - 1] = n
-                if c + 1 in next_beam_cols:
-                    next_beam_cols[c + 1] += n
-                else:
-                    next_beam_cols[c + 1] = n
-            if row[c] == '.':
-                if c in next_beam_cols:
-                    next_beam_cols[c] += n
-                else:
-                    next_beam_cols[c] = n
-        beam_cols = next_beam_cols
-    timelines = sum(beam_cols.values())
-    return timelines
+    return count_timelines(parsed_data)
+
+def get_part2_stream_solution(fn='input.txt'):
+    """Part 2 solution streamed row by row from the file."""
+    return count_timelines(iter_manifold_rows(fn))
+
+def count_splits_and_timelines(rows):
+    """Count both beam splits and timelines in a single pass over an iterable of rows."""
+    rows = iter(rows)
+    first_row = next(rows)
+    counts = np.zeros(len(first_row), dtype=np.int64)
+    counts[first_row.index('S')] = 1
+    splits = 0
+    for row in rows:
+        splitters = get_splitter_array(row)
+        # any column with a timeline holds a beam, so the part 1 splits fall out of the same counts
+        splits += int(np.count_nonzero(splitters & (counts != 0)))
+        counts = propagate_timelines(counts, splitters)
+    return splits, sum_timelines(counts)
+
+def get_both_solutions(parsed_data):
+    """Return the Part 1 and Part 2 solutions from one fused pass."""
+    return count_splits_and_timelines(parsed_data)
 
 def print_answer(answer, part=1):
     """Print the answer in a standard format."""
@@ -72,10 +131,9 @@ def main():
     """Main function to run the solution."""
     data = get_file_data()
     parsed_data = parse_data(data)
-    answer = get_part1_solution(parsed_data)
-    print_answer(answer, part=1)
-    answer = get_part2_solution(parsed_data)
-    print_answer(answer, part=2)
+    answer1, answer2 = get_both_solutions(parsed_data)
+    print_answer(answer1, part=1)
+    print_answer(answer2, part=2)
 
 if __name__ == '__main__':
     main()
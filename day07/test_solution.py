@@ -1,7 +1,12 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
+import numpy as np
 import pytest
 from .solution import parse_data, get_file_data, get_part1_solution, get_part2_solution
+from .solution import get_row_mask, propagate_beams
+from .solution import get_splitter_array, propagate_timelines, sum_timelines
+from .solution import iter_manifold_rows, get_part1_stream_solution, get_part2_stream_solution
+from .solution import count_splits_and_timelines, get_both_solutions
 
 
 @pytest.fixture(name="test_data")
@@ -48,3 +53,83 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_part1_solution(data) == 21
     assert get_part2_solution(data) == 40
+
+
+def test_bitset_beams(test_data):
+    """Test bitmask rows and beam propagation
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    assert get_row_mask(data[0]) == 0
+    assert get_row_mask(data[4]) == (1 << 6) | (1 << 8)
+    beams, splits = propagate_beams(1 << 7, get_row_mask(data[2]), (1 << 15) - 1)
+    assert beams == (1 << 6) | (1 << 8)
+    assert splits == 1
+    # beams split off the edge of the manifold are dropped
+    assert propagate_beams(0b1, 0b1, 0b11) == (0b10, 1)
+
+
+def test_dense_timelines(test_data):
+    """Test vectorized timeline counting and promotion past int64
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    assert get_splitter_array(data[2]).nonzero()[0].tolist() == [7]
+    counts = propagate_timelines(np.array([0, 2, 0], dtype=np.int64), np.array([False, True, False]))
+    assert counts.tolist() == [2, 0, 2]
+    big = np.array([0, 2 ** 62, 0], dtype=np.int64)
+    counts = propagate_timelines(big, np.array([False, True, False]))
+    assert counts.dtype == object
+    assert counts.tolist() == [2 ** 62, 0, 2 ** 62]
+    assert int(propagate_timelines(counts, np.array([True, False, True])).sum()) == 2 ** 63
+
+
+def test_streaming_rows():
+    """Test row-by-row processing straight from the file"""
+    test_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test.txt")
+    rows = iter_manifold_rows(test_file)
+    assert next(rows) == '.......S.......'
+    assert len(list(rows)) == 15
+    assert get_part1_stream_solution(test_file) == 21
+    assert get_part2_stream_solution(test_file) == 40
+
+
+def test_fused_solver(test_data):
+    """Test the single-pass solver returns both answers
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    assert get_both_solutions(data) == (21, 40)
+    test_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test.txt")
+    assert count_splits_and_timelines(iter_manifold_rows(test_file)) == (21, 40)
+
+
+def test_adjacent_splitters():
+    """Test that beams hitting neighbouring splitters all split, matching the timeline propagation"""
+    data = parse_data("...S...\n.......\n...^...\n.......\n....^..\n.......\n..^^...\n.......\n.^^^^..\n.......")
+    # both beams on the adjacent pair split, and a beam split onto the neighbouring splitter column carries on
+    assert propagate_beams(0b1100, 0b1100, 0b1111111) == (0b11110, 2)
+    # every occupied column of the timeline count splits again on the last splitter row: 1 + 1 + 2 + 4
+    assert get_part1_solution(data) == 8
+    assert get_part2_solution(data) == 9
+
+
+def test_timeline_total_overflow():
+    """Test a board whose columns stay within int64 while the total timeline count passes 2**63"""
+    width, start = 301, 150
+    rows = ['.' * start + 'S' + '.' * (width - start - 1)]
+    for r in range(65):
+        # splitters sit on every column a beam can reach in this row, so each row doubles the timelines
+        rows.append(''.join('^' if (c - start - r) % 2 == 0 else '.' for c in range(width)))
+    for num_rows, timelines in ((63, 2 ** 63), (64, 2 ** 64), (65, 2 ** 65)):
+        data = parse_data('\n'.join(rows[:num_rows + 1]))
+        assert get_part2_solution(data) == timelines
+        assert get_both_solutions(data)[1] == timelines
+    counts = np.full(8, 2 ** 61, dtype=np.int64)
+    assert sum_timelines(propagate_timelines(counts, np.zeros(8, dtype=bool))) == 2 ** 64
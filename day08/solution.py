@@ -1,13 +1,23 @@
 #!/usr/bin/env python3
 
+import heapq
 import logging
 import math
 import os
 import datetime
+from bisect import bisect_right
+from itertools import islice
+
+import numpy as np
 
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# memory ceiling for a single block of pairwise distances in the chunked generator
+DISTANCE_BLOCK_BYTES = 64 * 1024 * 1024
+# peak bytes per pair in a block: the int64 distances, one int64 temporary and a bool mask
+BLOCK_BYTES_PER_PAIR = 8 + 8 + 1
+
 def get_file_data(fn='input.txt'):
     """Read the input file and return its contents as a string."""
     with open(fn, encoding='utf-8') as f:
@@ -32,82 +42,301 @@ def craft_distance_lookup(parsed_data):
     logger.debug(msg=f"Total distances calculated: {len(distance_lookup)}")
     return distance_lookup
 
-def get_part1_solution(parsed_data, num_conn=10):
-    """Complete Part 1 solution here"""
-    dt = craft_distance_lookup(parsed_data)
+def iter_shortest_edges(distance_lookup):
+    """Yield junction pairs from the distance lookup in order of increasing distance."""
+    # heapify once and pop lazily so callers only pay for the edges they consume
+    heap = [(d, i, j) for (i, j), d in distance_lookup.items()]
+    heapq.heapify(heap)
+    while heap:
+        _, i, j = heapq.heappop(heap)
+        yield i, j
+
+def iter_distance_blocks(points, num_edges, max_bytes=DISTANCE_BLOCK_BYTES):
+    """Yield (i, j, squared distance) arrays of each row block's num_edges shortest pairs with i < j."""
+    n = len(points)
+    sentinel = np.iinfo(np.int64).max
+    start = 0
+    while start < n - 1:
+        # the distance block and one same-sized temporary are live together, plus a bool mask at the end
+        num_cols = n - start - 1
+        stop = min(start + max(1, max_bytes // (num_cols * BLOCK_BYTES_PER_PAIR)), n - 1)
+        rows = points[start:stop]
+        cols = points[start + 1:]
+        dist = np.zeros((stop - start, num_cols), dtype=np.int64)
+        diff = np.empty_like(dist)
+        for axis in range(points.shape[1]):
+            np.subtract(rows[:, axis, None], cols[None, :, axis], out=diff)
+            np.multiply(diff, diff, out=diff)
+            dist += diff
+        del diff
+        # pairs with j <= i sit in the lower-left corner of the block, push them out of contention in place
+        for r in range(1, stop - start):
+            dist[r, :r] = sentinel
+
+        flat = dist.ravel()
+        if num_edges < flat.size:
+            # partial partition for the cutoff, keeping ties so the final order matches a full sort
+            cutoff = np.partition(flat, num_edges - 1)[num_edges - 1] if num_edges else -1
+            picked = np.flatnonzero(flat <= cutoff)
+        else:
+            picked = np.arange(flat.size)
+        picked = picked[flat[picked] != sentinel]
+        picked_d = flat[picked]
+        # release the block before yielding so it is not still alive while the next one is allocated
+        del dist, flat
+        i_off, j_off = np.divmod(picked, num_cols)
+        yield i_off + start, j_off + start + 1, picked_d
+        start = stop
+
+def craft_shortest_edges(parsed_data, num_edges, max_bytes=DISTANCE_BLOCK_BYTES):
+    """Return the num_edges shortest junction pairs ordered by (distance, i, j)."""
+    points = np.asarray(parsed_data, dtype=np.int64)
+    best_i = np.empty(0, dtype=np.int64)
+    best_j = np.empty(0, dtype=np.int64)
+    best_d = np.empty(0, dtype=np.int64)
+    for block_i, block_j, block_d in iter_distance_blocks(points, num_edges, max_bytes):
+        # each block arrives already cut down to num_edges, so the running set stays O(num_edges)
+        best_i = np.concatenate((best_i, block_i))
+        best_j = np.concatenate((best_j, block_j))
+        best_d = np.concatenate((best_d, block_d))
+        if len(best_d) > num_edges:
+            cutoff = np.partition(best_d, num_edges - 1)[num_edges - 1] if num_edges else -1
+            keep = best_d <= cutoff
+            best_i, best_j, best_d = best_i[keep], best_j[keep], best_d[keep]
+    order = np.lexsort((best_j, best_i, best_d))[:num_edges]
+    return list(zip(best_i[order].tolist(), best_j[order].tolist()))
+
+def iter_chunked_shortest_edges(parsed_data, max_bytes=DISTANCE_BLOCK_BYTES):
+    """Yield junction pairs in order of increasing distance using bounded-memory NumPy blocks."""
+    # fetch a growing top-k window and only yield the edges not seen in the previous window
+    num_edges = max(len(parsed_data), 1)
+    done = 0
+    while True:
+        edges = craft_shortest_edges(parsed_data, num_edges, max_bytes)
+        yield from edges[done:]
+        if len(edges) < num_edges:
+            return
+        done = num_edges
+        num_edges *= 4
 
-    # index is which junction, value is which circuit it belongs to
-    j_to_c = list(range(len(parsed_data)))
+def craft_spatial_grid(parsed_data, points_per_cell=2):
+    """Bucket junctions into a uniform 3D grid, returning the buckets, cell size and grid extent."""
+    mins = [min(axis) for axis in zip(*parsed_data)]
+    maxs = [max(axis) for axis in zip(*parsed_data)]
+    # size cells from the axes that actually vary, so flat or line-like inputs do not get tiny cells
+    spans = [hi - lo + 1 for lo, hi in zip(mins, maxs) if hi > lo]
+    volume = math.prod(spans)
+    # pick a cell edge so each occupied cell holds only a handful of junctions
+    cell_size = max(1, math.ceil((volume * points_per_cell / len(parsed_data)) ** (1 / max(len(spans), 1))))
+    grid = {}
+    for j, entry in enumerate(parsed_data):
+        cell = tuple((v - lo) // cell_size for v, lo in zip(entry, mins))
+        grid.setdefault(cell, []).append(j)
+    extent = max((hi - lo) // cell_size for lo, hi in zip(mins, maxs))
+    return grid, cell_size, extent, mins
 
-    # index is which circuit, value is list of junctions in that circuit
+def iter_shell_cells(cell, r):
+    """Yield every grid cell at Chebyshev distance exactly r from cell."""
+    cx, cy, cz = cell
+    for dx in range(-r, r + 1):
+        for dy in range(-r, r + 1):
+            if abs(dx) == r or abs(dy) == r:
+                dzs = range(-r, r + 1)
+            else:
+                dzs = (-r, r) if r else (0,)
+            for dz in dzs:
+                yield cx + dx, cy + dy, cz + dz
+
+def iter_spatial_neighbors(i, parsed_data, grid, cell_size, extent, mins):
+    """Yield (distance, j) for junctions j > i in order of increasing (distance, j)."""
+    entry = parsed_data[i]
+    cell = tuple((v - lo) // cell_size for v, lo in zip(entry, mins))
+    candidates = []
+    # junctions j > i not yet pushed; once none are left there is nothing further out to find
+    remaining = len(parsed_data) - 1 - i
+    for r in range(extent + 1):
+        if remaining == 0:
+            break
+        if (2 * r + 1) ** 3 - (2 * r - 1) ** 3 > len(grid):
+            # the shell has more cells than the grid has buckets, so sweep the occupied cells left instead
+            shell_cells = [c for c in grid if max(abs(a - b) for a, b in zip(c, cell)) >= r]
+        else:
+            shell_cells = iter_shell_cells(cell, r)
+        for shell_cell in shell_cells:
+            for j in grid.get(shell_cell, ()):
+                if j > i:
+                    entry2 = parsed_data[j]
+                    d = (entry[0] - entry2[0])**2 + (entry[1] - entry2[1])**2 + (entry[2] - entry2[2])**2
+                    heapq.heappush(candidates, (d, j))
+                    remaining -= 1
+        # anything beyond shell r is strictly further than r whole cells away
+        radius = (r * cell_size) ** 2
+        while candidates and candidates[0][0] <= radius:
+            yield heapq.heappop(candidates)
+    while candidates:
+        yield heapq.heappop(candidates)
+
+def iter_spatial_shortest_edges(parsed_data):
+    """Yield junction pairs in order of increasing distance by k-nearest-neighbour expansion over a grid."""
+    grid, cell_size, extent, mins = craft_spatial_grid(parsed_data)
+    logger.debug(msg=f"Spatial grid with cell size {cell_size} and {len(grid)} occupied cells")
+    # each junction contributes only its next-nearest unseen neighbour to the global heap
+    streams = {}
+    heap = []
+    for i in range(len(parsed_data)):
+        stream = iter_spatial_neighbors(i, parsed_data, grid, cell_size, extent, mins)
+        head = next(stream, None)
+        if head is not None:
+            streams[i] = stream
+            heapq.heappush(heap, (head[0], i, head[1]))
+    while heap:
+        _, i, j = heapq.heappop(heap)
+        yield i, j
+        head = next(streams[i], None)
+        if head is not None:
+            heapq.heappush(heap, (head[0], i, head[1]))
+
+def iter_edges(parsed_data, mode='chunked'):
+    """Yield junction pairs in order of increasing distance using the selected edge source."""
+    if mode == 'lookup':
+        return iter_shortest_edges(craft_distance_lookup(parsed_data))
+    if mode == 'chunked':
+        return iter_chunked_shortest_edges(parsed_data)
+    if mode == 'spatial':
+        return iter_spatial_shortest_edges(parsed_data)
+    raise ValueError(f"Unknown edge mode: {mode}")
+
+def find_circuit(parent, j):
+    """Find the root junction of the circuit containing junction j, compressing the path."""
+    root = j
+    while parent[root] != root:
+        root = parent[root]
+    while parent[j] != root:
+        parent[j], j = root, parent[j]
+    return root
+
+def merge_circuits(parent, size, j1, j2):
+    """Merge the circuits of j1 and j2 by size, returning False if already connected."""
+    c1 = find_circuit(parent, j1)
+    c2 = find_circuit(parent, j2)
+    if c1 == c2:
+        return False
+    if size[c1] < size[c2]:
+        c1, c2 = c2, c1
+    parent[c2] = c1
+    size[c1] += size[c2]
+    return True
+
+def get_part1_solution(parsed_data, num_conn=10, mode='chunked'):
+    """Complete Part 1 solution here"""
+    edges = iter_edges(parsed_data, mode)
+
+    # index is which junction, value is its parent junction in the circuit tree
     # starts with each junction in its own circuit
-    c = [[i] for i in range(len(parsed_data))]
-    conn_made = 0
-    while conn_made < num_conn:
-        closest_pair = min(dt, key=dt.get)
-        j1, j2 = closest_pair
-        # get circuit indices
-        c1 = j_to_c[j1]
-        c2 = j_to_c[j2]
-
-        # same circuit, skip
-        if c1 == c2:
-            logger.debug(msg=f"Pair {closest_pair} already in circuit {c1}, skipping")
+    parent = list(range(len(parsed_data)))
+    size = [1] * len(parsed_data)
+    for conn_made, (j1, j2) in enumerate(islice(edges, num_conn), 1):
+        if merge_circuits(parent, size, j1, j2):
+            logger.debug(msg=f"Merged circuits of junctions {j1} and {j2}")
         else:
-            # new to merge each entry in circuit2 to circuit1
-            while c[c2]:
-                j = c[c2].pop()
-                c[c1].append(j)
-                j_to_c[j] = c1
-            logger.debug(msg=f"Merged circuits {c2} into {c1}, new circuit:"
-                        + f" {c[c1]}")
-            logger.debug(msg=f"Circuit count: {len([c for c in c if c])}")
-            logger.debug(msg=f"Current circuits: {c}")
-            logger.debug(msg=f"Current junctions to circuits mapping: {j_to_c}")
-
-        conn_made += 1
+            logger.debug(msg=f"Pair {(j1, j2)} already in same circuit, skipping")
         logger.debug(msg=f"Connections made: {conn_made}/{num_conn}")
-        del dt[closest_pair]
-    sizes = [len(circuit) for circuit in c]
+    sizes = [size[j] for j in range(len(parsed_data)) if parent[j] == j]
     max_3 = sorted(sizes, reverse=True)[:3]
     return math.prod(max_3)
 
-def get_part2_solution(parsed_data):
+def get_part2_solution(parsed_data, mode='chunked'):
     """Complete Part 2 solution here"""
-    dt = craft_distance_lookup(parsed_data)
-
-    # index is which junction, value is which circuit it belongs to
-    j_to_c = list(range(len(parsed_data)))
+    edges = iter_edges(parsed_data, mode)
 
-    # index is which circuit, value is list of junctions in that circuit
-    # starts with each junction in its own circuit
-    c = [[i] for i in range(len(parsed_data))]
-    num_circuits = len([c for c in c if c])
-    while num_circuits > 1:
-        closest_pair = min(dt, key=dt.get)
-        j1, j2 = closest_pair
-        # get circuit indices
-        c1 = j_to_c[j1]
-        c2 = j_to_c[j2]
-
-        # same circuit, skip
-        if c1 == c2:
-            logger.debug(msg=f"Pair {closest_pair} already in circuit {c1}, skipping")
-        else:
-            # new to merge each entry in circuit2 to circuit1
-            while c[c2]:
-                j = c[c2].pop()
-                c[c1].append(j)
-                j_to_c[j] = c1
+    parent = list(range(len(parsed_data)))
+    size = [1] * len(parsed_data)
+    num_circuits = len(parsed_data)
+    for j1, j2 in edges:
+        if merge_circuits(parent, size, j1, j2):
             num_circuits -= 1
-            logger.debug(msg=f"Merged circuits {c2} into {c1}, new circuit:"
-                        + f" {c[c1]}")
+            logger.debug(msg=f"Merged circuits of junctions {j1} and {j2}")
             logger.debug(msg=f"Circuit count: {num_circuits}")
-            # logger.debug(msg=f"Current circuits: {c}")
-            # logger.debug(msg=f"Current junctions to circuits mapping: {j_to_c}")
         if num_circuits == 1:
             return parsed_data[j1][0] * parsed_data[j2][0]
-        del dt[closest_pair]
+    return None
+
+class CircuitTracker:
+    """Track circuits incrementally as junctions arrive one at a time."""
+
+    def __init__(self, num_conn=10):
+        self.num_conn = num_conn
+        self.points = []
+        # minimum spanning forest edges as (distance, i, j), kept sorted; connectivity of any prefix matches
+        self.mst = []
+        # max-heap of the num_conn shortest pairs seen so far, stored with negated keys
+        self.shortest = []
+        # circuit sizes after the tracked connections and the three largest, kept current between inserts
+        self.circuit_sizes = []
+        self.top3_sizes = []
+
+    def add_junction(self, point):
+        """Add a junction, updating the spanning tree and shortest pairs from its new edges only."""
+        j = len(self.points)
+        new_edges = []
+        for i, entry in enumerate(self.points):
+            d = (entry[0] - point[0])**2 + (entry[1] - point[1])**2 + (entry[2] - point[2])**2
+            new_edges.append((d, i, j))
+        new_edges.sort()
+        self.points.append(point)
+
+        shortest_changed = False
+        for edge in new_edges:
+            key = tuple(-x for x in edge)
+            if len(self.shortest) < self.num_conn:
+                heapq.heappush(self.shortest, key)
+            elif self.num_conn and key > self.shortest[0]:
+                heapq.heapreplace(self.shortest, key)
+            else:
+                # new edges are sorted, so none of the rest can make the cut either
+                break
+            shortest_changed = True
+
+        # the new spanning tree only ever uses old tree edges plus edges touching the new junction
+        parent = list(range(len(self.points)))
+        size = [1] * len(self.points)
+        self.mst = [edge for edge in heapq.merge(self.mst, new_edges) if merge_circuits(parent, size, edge[1], edge[2])]
+
+        if shortest_changed:
+            self.rebuild_circuit_sizes()
+        else:
+            # with the cutoff unchanged no tree edge under it is displaced, so the junction is a lone circuit
+            self.circuit_sizes.append(1)
+            if len(self.top3_sizes) < 3:
+                self.top3_sizes.append(1)
+        return j
+
+    def rebuild_circuit_sizes(self):
+        """Recompute circuit sizes from the spanning tree edges up to the longest tracked pair."""
+        cutoff = tuple(-x for x in self.shortest[0]) if self.shortest else None
+        parent = list(range(len(self.points)))
+        size = [1] * len(self.points)
+        if cutoff is not None:
+            for _, j1, j2 in self.mst[:bisect_right(self.mst, cutoff)]:
+                merge_circuits(parent, size, j1, j2)
+        self.circuit_sizes = [size[j] for j in range(len(self.points)) if parent[j] == j]
+        self.top3_sizes = heapq.nlargest(3, self.circuit_sizes)
+
+    def get_circuit_sizes(self):
+        """Return circuit sizes after connecting the num_conn shortest pairs."""
+        return list(self.circuit_sizes)
+
+    def get_top3_product(self):
+        """Return the product of the three largest circuits after the tracked connections."""
+        return math.prod(self.top3_sizes)
+
+    def get_last_connection(self):
+        """Return the pair of junctions whose connection first joins everything into one circuit."""
+        if not self.mst:
+            return None
+        # the tree is kept sorted, so its longest edge is the last one
+        _, j1, j2 = self.mst[-1]
+        return j1, j2
 
 def print_answer(answer, part=1):
     """Print the answer in a standard format."""
@@ -1,7 +1,12 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
+import tracemalloc
+from itertools import islice
+import numpy as np
 import pytest
 from .solution import parse_data, get_file_data, get_part1_solution, get_part2_solution
+from .solution import find_circuit, merge_circuits, iter_edges, iter_chunked_shortest_edges, craft_shortest_edges
+from .solution import iter_shell_cells, craft_spatial_grid, CircuitTracker, iter_distance_blocks
 
 
 @pytest.fixture(name="test_data")
@@ -48,3 +53,104 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_part1_solution(data) == 40
     assert get_part2_solution(data) == 25272
+
+
+def test_merge_circuits():
+    """Test union-find circuit merging used by both parts"""
+    parent = list(range(4))
+    size = [1] * 4
+    assert merge_circuits(parent, size, 0, 1)
+    assert merge_circuits(parent, size, 2, 3)
+    assert not merge_circuits(parent, size, 1, 0)
+    assert merge_circuits(parent, size, 1, 3)
+    assert find_circuit(parent, 0) == find_circuit(parent, 2)
+    assert size[find_circuit(parent, 0)] == 4
+
+
+def test_chunked_edges(test_data):
+    """Test the bounded-memory edge generator against the full distance lookup
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    expected = list(iter_edges(data, mode='lookup'))
+    # a tiny ceiling forces one row per block and several top-k window refills
+    assert list(iter_chunked_shortest_edges(data, max_bytes=1)) == expected
+    assert craft_shortest_edges(data, 5, max_bytes=1) == expected[:5]
+    assert get_part1_solution(data, mode='lookup') == 40
+    assert get_part2_solution(data, mode='lookup') == 25272
+
+
+def test_spatial_edges(test_data):
+    """Test the grid-bucket edge generator against the full distance lookup
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    assert list(iter_edges(data, mode='spatial')) == list(iter_edges(data, mode='lookup'))
+    assert len(list(iter_shell_cells((0, 0, 0), 1))) == 26
+    assert get_part1_solution(data, mode='chunked') == 40
+    assert get_part2_solution(data, mode='chunked') == 25272
+
+
+def test_circuit_tracker(test_data):
+    """Test incremental circuit tracking against the batch solutions
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    tracker = CircuitTracker(num_conn=10)
+    for n, point in enumerate(data, 1):
+        tracker.add_junction(point)
+        assert tracker.get_top3_product() == get_part1_solution(data[:n])
+    j1, j2 = tracker.get_last_connection()
+    assert data[j1][0] * data[j2][0] == 25272
+    assert sum(tracker.get_circuit_sizes()) == len(data)
+
+
+def test_chunked_memory_ceiling():
+    """Test the distance blocks stay within the configured memory ceiling"""
+    points = np.random.default_rng(0).integers(0, 100000, (2000, 3))
+    max_bytes = 1024 * 1024
+    tracemalloc.start()
+    try:
+        for _ in iter_distance_blocks(points, 100, max_bytes):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak <= max_bytes * 1.1
+    edges = craft_shortest_edges(points.tolist(), 100, max_bytes)
+    assert edges == list(islice(iter_edges(points.tolist(), mode='spatial'), 100))
+
+
+def test_circuit_tracker_queries():
+    """Test cached circuit queries and the lone junction fast path"""
+    tracker = CircuitTracker(num_conn=2)
+    for point in [[0, 0, 0], [1, 0, 0], [10, 0, 0], [11, 0, 0]]:
+        tracker.add_junction(point)
+    assert sorted(tracker.get_circuit_sizes()) == [2, 2]
+    assert tracker.get_last_connection() == (1, 2)
+    # a far junction adds no tracked pair, so it only appends a lone circuit
+    tracker.add_junction([1000, 0, 0])
+    assert sorted(tracker.get_circuit_sizes()) == [1, 2, 2]
+    assert tracker.get_top3_product() == 4
+    assert tracker.get_last_connection() == (3, 4)
+    assert tracker.mst == sorted(tracker.mst)
+
+
+def test_spatial_coplanar_points():
+    """Test the grid-bucket edge generator on flat and line-like inputs"""
+    rng = np.random.default_rng(0)
+    flat = np.column_stack([rng.integers(0, 100000, (1000, 2)), np.full(1000, 7)]).tolist()
+    # cells are sized from the two varying axes rather than collapsing towards 1
+    _, cell_size, extent, _ = craft_spatial_grid(flat)
+    assert cell_size > 1000
+    assert extent < 100
+    assert get_part1_solution(flat, mode='spatial') == get_part1_solution(flat, mode='chunked')
+    assert get_part2_solution(flat, mode='spatial') == get_part2_solution(flat, mode='chunked')
+    line = np.column_stack([rng.integers(0, 1000, 200), np.zeros((200, 2), dtype=np.int64)]).tolist()
+    assert list(iter_edges(line, mode='spatial')) == list(iter_edges(line, mode='lookup'))
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
 
+import heapq
 import logging
+import multiprocessing
 import os
+from array import array
+from bisect import insort
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing import shared_memory
+from operator import add
+
+import numpy as np
 
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
@@ -17,18 +27,61 @@ def parse_data(text_data):
     parsed_data = [[int(x) for x in line.split(',')] for line in text_data.strip('\n ').split('\n')]
     return parsed_data
 
+def get_pareto_frontier(points, sign_x, sign_y):
+    """Return the points not dominated towards (sign_x * -inf, sign_y * -inf)"""
+    frontier = []
+    best_y = None
+    for x, y in sorted(points, key=lambda p: (sign_x * p[0], sign_y * p[1])):
+        if best_y is None or sign_y * y < best_y:
+            frontier.append((x, y))
+            best_y = sign_y * y
+    return frontier
+
 def get_part1_solution(parsed_data):
     """Complete Part 1 solution here"""
+    # an optimal rectangle always pairs opposite corner staircases, so only those are compared
     highest_area = 0
-    for i, entry1 in enumerate(parsed_data):
-        for j, entry2 in enumerate(parsed_data, i+1):
-            x1, y1 = entry1
-            x2, y2 = entry2
-            area = (abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
-            if area > highest_area:
-                highest_area = area
+    for sign_y in (1, -1):
+        low_corners = get_pareto_frontier(parsed_data, 1, sign_y)
+        high_corners = get_pareto_frontier(parsed_data, -1, -sign_y)
+        logger.debug(msg=f"Comparing {len(low_corners)} x {len(high_corners)} staircase corners")
+        for x1, y1 in low_corners:
+            for x2, y2 in high_corners:
+                area = (abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
+                if area > highest_area:
+                    highest_area = area
     return highest_area
 
+def iter_pairs_by_area(parsed_data):
+    """Yield (area, entry1, entry2) for every pair of red tiles in order of decreasing area"""
+    points = np.asarray(parsed_data, dtype=np.int64).reshape(-1, 2)
+    xs, ys = points[:, 0], points[:, 1]
+
+    def row_areas(i):
+        return (np.abs(xs[i + 1:] - xs[i]) + 1) * (np.abs(ys[i + 1:] - ys[i]) + 1)
+
+    # the heap holds one head per row; a row's partner order is only built once its head is used up
+    heap = []
+    for i in range(len(points) - 1):
+        areas = row_areas(i)
+        best = int(areas.argmax())
+        heap.append((-int(areas[best]), i, 0, i + 1 + best))
+    heapq.heapify(heap)
+    row_orders = {}
+    while heap:
+        neg_area, i, pos, j = heapq.heappop(heap)
+        yield -neg_area, (int(xs[i]), int(ys[i])), (int(xs[j]), int(ys[j]))
+        if i not in row_orders:
+            # stable order keeps the argmax head first among equal areas
+            row_orders[i] = np.argsort(-row_areas(i), kind='stable').astype(np.int32)
+        order = row_orders[i]
+        if pos + 1 < len(order):
+            j = i + 1 + int(order[pos + 1])
+            area = (abs(int(xs[j]) - int(xs[i])) + 1) * (abs(int(ys[j]) - int(ys[i])) + 1)
+            heapq.heappush(heap, (-area, i, pos + 1, j))
+        else:
+            del row_orders[i]
+
 def get_sparse_entries(parsed_data):
     """Helper function to identify sparse entries"""
     orig_x_coords, orig_y_coords = zip(*parsed_data)
@@ -53,91 +106,139 @@ def get_sparse_entries(parsed_data):
 
     return x_to_sparse, y_to_sparse, sparse_to_x, sparse_to_y
 
-def check_all_points_filled(sparse_matrix, sx1, sy1, sx2, sy2):
-    """Check if all points in the rectangle defined by (sx1, sy1) and (sx2, sy2) are filled"""
-    for x in range(min(sx1, sx2), max(sx1, sx2) + 1):
-        for y in range(min(sy1, sy2), max(sy1, sy2) + 1):
-            if sparse_matrix[x][y] <= 0:
-                return False
-    return True
+def build_outside_prefix_sums(grid, num_y):
+    """Build a flat summed-area table counting outside (unfilled) cells of the compressed grid"""
+    num_x = len(grid) // num_y
+    prefix = array('q', bytes(8 * (num_y + 1)))
+    above = prefix[0:num_y + 1]
+    for x in range(num_x):
+        row = grid[x * num_y:(x + 1) * num_y]
+        running = accumulate((val <= 0 for val in row), initial=0)
+        above = array('q', map(add, above, running))
+        prefix.extend(above)
+    return prefix
 
-def get_part2_solution(parsed_data):
-    """Complete Part 2 solution here"""
-    # Build sparse mappings
-    x_to_sparse, y_to_sparse, sparse_to_x, sparse_to_y = get_sparse_entries(parsed_data)
+def count_outside_points(prefix, num_y, sx1, sy1, sx2, sy2):
+    """Count outside cells in the rectangle defined by (sx1, sy1) and (sx2, sy2) in constant time"""
+    stride = num_y + 1
+    x_lo, x_hi = min(sx1, sx2) * stride, (max(sx1, sx2) + 1) * stride
+    y_lo, y_hi = min(sy1, sy2), max(sy1, sy2) + 1
+    return prefix[x_hi + y_hi] - prefix[x_lo + y_hi] - prefix[x_hi + y_lo] + prefix[x_lo + y_lo]
 
-    # Initialize sparse matrix
-    sparse_matrix = [[0 for _ in range(len(sparse_to_y))] for _ in range(len(sparse_to_x))]
+def get_polygon_edges(parsed_data, x_to_sparse, y_to_sparse):
+    """Return the closed polygon as a list of sparse coordinate segments"""
+    sparse_points = [(x_to_sparse[x], y_to_sparse[y]) for x, y in parsed_data]
+    edges = []
+    for (lx, ly), (sx, sy) in zip(sparse_points, sparse_points[1:] + sparse_points[:1]):
+        if lx != sx and ly != sy:
+            logger.error("Diagonal movement not supported")
+            continue
+        edges.append((lx, ly, sx, sy))
+    return edges
 
-    # Populate sparse matrix
-    last_sp = None
-    for x, y in parsed_data:
-        sx = x_to_sparse[x]
-        sy = y_to_sparse[y]
-        sparse_matrix[sx][sy] = 1 # mark as corner (red)
-        if last_sp is None:
-            last_sp = (sx, sy)
+def build_compressed_grid(parsed_data, x_to_sparse, y_to_sparse, num_x, num_y):
+    """Build the flat compressed grid marking outside (-1), corner (1), edge (2) and inside (3) cells"""
+    edges = get_polygon_edges(parsed_data, x_to_sparse, y_to_sparse)
+    grid = array('b', [-1]) * (num_x * num_y)
+
+    # scanline parity: sweep columns keeping the y of every constant-y edge spanning [x_lo, x_hi)
+    starts, stops = {}, {}
+    for lx, ly, sx, sy in edges:
+        if ly == sy and lx != sx:
+            starts.setdefault(min(lx, sx), []).append(ly)
+            stops.setdefault(max(lx, sx), []).append(ly)
+    active = []
+    for x in range(num_x):
+        for y in stops.get(x, ()):
+            active.remove(y)
+        for y in starts.get(x, ()):
+            insort(active, y)
+        # between alternating crossings the cells are inside the polygon
+        base = x * num_y
+        for y_in, y_out in zip(active[0::2], active[1::2]):
+            grid[base + y_in + 1:base + y_out] = array('b', [3]) * (y_out - y_in - 1)
+
+    # draw the boundary over the classification
+    for lx, ly, sx, sy in edges:
+        if lx == sx:
+            grid[lx * num_y + min(ly, sy):lx * num_y + max(ly, sy) + 1] = array('b', [2]) * (abs(sy - ly) + 1)
         else:
-            # Fill in between last_sp and current (sx, sy)
-            lx, ly = last_sp
-            if lx == sx:
-                for y_fill in range(min(ly, sy), max(ly, sy) + 1):
-                    if sparse_matrix[lx][y_fill] == 0:
-                        sparse_matrix[lx][y_fill] = 2 # mark as edge (green)
-            elif ly == sy:
-                for x_fill in range(min(lx, sx), max(lx, sx) + 1):
-                    if sparse_matrix[x_fill][ly] == 0:
-                        sparse_matrix[x_fill][ly] = 2 # mark as edge (green)
-            else:
-                logger.error("Diagonal movement not supported")
-            last_sp = (sx, sy)
-
-    # Fill in from last point to first point to close the loop
-    sx = x_to_sparse[parsed_data[0][0]]
-    sy = y_to_sparse[parsed_data[0][1]]
-    lx, ly = last_sp
-    if lx == sx:
-        for y_fill in range(min(ly, sy), max(ly, sy) + 1):
-            if sparse_matrix[lx][y_fill] == 0:
-                sparse_matrix[lx][y_fill] = 2 # mark as edge (green)
-    elif ly == sy:
-        for x_fill in range(min(lx, sx), max(lx, sx) + 1):
-            if sparse_matrix[x_fill][ly] == 0:
-                sparse_matrix[x_fill][ly] = 2 # mark as edge (green)
-    else:
-        logger.error("Diagonal movement not supported")
-
-    points = set([(0,0)])
-    while points:
-        x, y = points.pop()
-        # if point is unmarked, mark as outside and add neighbors
-        if sparse_matrix[x][y] == 0:
-            sparse_matrix[x][y] = -1 # mark as outside (blue)
-            for dx, dy in [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < len(sparse_to_x) and 0 <= ny < len(sparse_to_y):
-                    if sparse_matrix[nx][ny] == 0:
-                        points.add((nx, ny))
-
-    for i, row in enumerate(sparse_matrix):
-        for j, val in enumerate(row):
-            if val == 0:
-                sparse_matrix[i][j] = 3 # mark as inside (yellow)
-
-    # Review all point combinations for valid areas in sparse matrix and track the highest area
+            for x_fill in range(min(lx, sx), max(lx, sx) + 1):
+                grid[x_fill * num_y + ly] = 2 # mark as edge (green)
+    for x, y in parsed_data:
+        grid[x_to_sparse[x] * num_y + y_to_sparse[y]] = 1 # mark as corner (red)
+    return grid
+
+PAIR_WORKER = {}
+
+def init_pair_worker(shm_name, num_y, tiles, incumbent):
+    """Worker initializer: attach the shared prefix table and keep the tiles and incumbent area for every chunk"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    PAIR_WORKER.update(shm=shm, prefix=shm.buf.cast('q'), num_y=num_y, tiles=tiles,
+                       coords=np.array([(x, y) for x, y, _, _ in tiles], dtype=np.int64).reshape(-1, 2),
+                       incumbent=incumbent)
+
+def get_chunk_highest_area(rows, step):
+    """Worker: return the highest valid area for pairs starting at rows[::step], pruned by the shared incumbent"""
+    prefix, num_y, tiles = PAIR_WORKER['prefix'], PAIR_WORKER['num_y'], PAIR_WORKER['tiles']
+    coords, incumbent = PAIR_WORKER['coords'], PAIR_WORKER['incumbent']
     highest_area = 0
-    for i, entry1 in enumerate(parsed_data):
-        for _, entry2 in enumerate(parsed_data, i+1):
-            x1, y1 = entry1
-            x2, y2 = entry2
-            area = (abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
-            sx1, sx2 = x_to_sparse[x1], x_to_sparse[x2]
-            sy1, sy2 = y_to_sparse[y1], y_to_sparse[y2]
-            valid = check_all_points_filled(sparse_matrix, sx1, sy1, sx2, sy2)
-            if valid and area > highest_area:
-                highest_area = area
+    for i in range(rows, len(tiles), step):
+        _, _, sx1, sy1 = tiles[i]
+        areas = np.prod(np.abs(coords[i + 1:] - coords[i]) + 1, axis=1)
+        # walk the row from its largest area down; nothing below the incumbent can win
+        for j in np.argsort(-areas, kind='stable'):
+            area = int(areas[j])
+            if area <= incumbent.value:
+                break
+            _, _, sx2, sy2 = tiles[i + 1 + j]
+            if count_outside_points(prefix, num_y, sx1, sy1, sx2, sy2) == 0:
+                highest_area = max(highest_area, area)
+                with incumbent.get_lock():
+                    incumbent.value = max(incumbent.value, area)
+                break
     return highest_area
 
+def get_parallel_highest_area(parsed_data, x_to_sparse, y_to_sparse, prefix, num_y, workers):
+    """Evaluate all pairs across a process pool sharing the prefix table, returning the highest valid area"""
+    tiles = [(x, y, x_to_sparse[x], y_to_sparse[y]) for x, y in parsed_data]
+    # striding rows across chunks balances the shrinking pair count of later rows
+    num_chunks = min(len(tiles), workers * 4) or 1
+    # the best area found by any worker, so every row can stop once it cannot beat it
+    incumbent = multiprocessing.Value('q', 0)
+    shm = shared_memory.SharedMemory(create=True, size=max(prefix.itemsize * len(prefix), 1))
+    try:
+        shm.buf[:prefix.itemsize * len(prefix)] = prefix.tobytes()
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_pair_worker,
+                                 initargs=(shm.name, num_y, tiles, incumbent)) as executor:
+            futures = [executor.submit(get_chunk_highest_area, c, num_chunks) for c in range(num_chunks)]
+            chunk_areas = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+    logger.debug(msg=f"Chunk highest areas: {chunk_areas}")
+    return max(chunk_areas)
+
+def get_part2_solution(parsed_data, workers=1):
+    """Complete Part 2 solution here"""
+    # Build sparse mappings
+    x_to_sparse, y_to_sparse, sparse_to_x, sparse_to_y = get_sparse_entries(parsed_data)
+    num_y = len(sparse_to_y)
+    grid = build_compressed_grid(parsed_data, x_to_sparse, y_to_sparse, len(sparse_to_x), num_y)
+
+    prefix = build_outside_prefix_sums(grid, num_y)
+    if workers > 1:
+        return get_parallel_highest_area(parsed_data, x_to_sparse, y_to_sparse, prefix, num_y, workers)
+
+    # Review point combinations from largest area down and stop at the first valid rectangle
+    for checked, (area, (x1, y1), (x2, y2)) in enumerate(iter_pairs_by_area(parsed_data), 1):
+        sx1, sx2 = x_to_sparse[x1], x_to_sparse[x2]
+        sy1, sy2 = y_to_sparse[y1], y_to_sparse[y2]
+        if count_outside_points(prefix, num_y, sx1, sy1, sx2, sy2) == 0:
+            logger.debug(msg=f"Found largest valid rectangle after checking {checked} pairs")
+            return area
+    return 0
+
 def print_answer(answer, part=1):
     """Print the answer in a standard format."""
     dirname = os.path.basename(os.getcwd())
@@ -1,7 +1,10 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
+from array import array
 import pytest
 from .solution import parse_data, get_file_data, get_part1_solution, get_part2_solution
+from .solution import build_outside_prefix_sums, count_outside_points
+from .solution import get_sparse_entries, build_compressed_grid, get_pareto_frontier, iter_pairs_by_area
 
 
 @pytest.fixture(name="test_data")
@@ -50,3 +53,61 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_part1_solution(data) == 50
     assert get_part2_solution(data) == 24
+
+
+def test_outside_prefix_sums():
+    """Test constant-time rectangle validity against the cell-by-cell scan"""
+    grid = array('b', [-1, 1, 2, 3, 3, -1, 1, 2, 3])
+    prefix = build_outside_prefix_sums(grid, 3)
+    for sx1 in range(3):
+        for sy1 in range(3):
+            for sx2 in range(3):
+                for sy2 in range(3):
+                    cells = [grid[x * 3 + y] for x in range(min(sx1, sx2), max(sx1, sx2) + 1)
+                             for y in range(min(sy1, sy2), max(sy1, sy2) + 1)]
+                    filled = all(val > 0 for val in cells)
+                    assert (count_outside_points(prefix, 3, sx1, sy1, sx2, sy2) == 0) == filled
+
+
+def test_compressed_grid(test_data):
+    """Test scanline classification of the compressed grid
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    x_to_sparse, y_to_sparse, sparse_to_x, sparse_to_y = get_sparse_entries(data)
+    num_y = len(sparse_to_y)
+    grid = build_compressed_grid(data, x_to_sparse, y_to_sparse, len(sparse_to_x), num_y)
+    assert len(grid) == len(sparse_to_x) * num_y
+    assert grid[x_to_sparse[7] * num_y + y_to_sparse[1]] == 1
+    assert grid[x_to_sparse[8] * num_y + y_to_sparse[3]] == 3
+    assert grid[0] == -1
+    assert list(grid).count(-1) == 50
+
+
+def test_area_ordered_search(test_data):
+    """Test the staircase fast path and area-ordered pair generation
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    assert get_pareto_frontier(data, 1, 1) == [(2, 3), (7, 1)]
+    areas = [area for area, _, _ in iter_pairs_by_area(data)]
+    assert len(areas) == len(data) * (len(data) - 1) // 2
+    assert areas == sorted(areas, reverse=True)
+    assert areas[0] == get_part1_solution(data)
+    # an interior point off the convex hull can still give the largest rectangle
+    assert get_part1_solution([[17, 13], [15, 11], [7, 2], [2, 20], [2, 16]]) == 140
+
+
+def test_parallel_part2(test_data):
+    """Test the process pool part 2 path matches the serial search
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    assert get_part2_solution(data, workers=2) == 24
+    assert get_part2_solution(data, workers=3) == get_part2_solution(data)
@@ -1,13 +1,23 @@
 #!/usr/bin/env python3
 
+import hashlib
 import logging
+import math
+import multiprocessing
 import os
+import signal
+from fractions import Fraction
 from functools import reduce
 from itertools import combinations
 
+import numpy as np
+
 logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
+# (part, machine content hash) -> minimum presses, shared by every input solved in this process
+MACHINE_CACHE = {}
+
 def get_file_data(fn='input.txt'):
     """Read the input file and return its contents as a string."""
     with open(fn, encoding='utf-8') as f:
@@ -36,102 +46,292 @@ def parse_data(text_data):
         entries.append(entry)
     return entries
 
-def get_part1_solution(parsed_data):
+def reduce_gf2_system(objective, buttons):
+    """Row-reduce the button masks over GF(2), returning a particular press set and the nullspace basis."""
+    # basis maps pivot light bit -> (light mask, button set producing that mask)
+    basis = {}
+    null_basis = []
+    for j, button in enumerate(buttons):
+        vec, combo = button, 1 << j
+        while vec:
+            pivot = vec.bit_length() - 1
+            if pivot not in basis:
+                basis[pivot] = (vec, combo)
+                break
+            pivot_vec, pivot_combo = basis[pivot]
+            vec ^= pivot_vec
+            combo ^= pivot_combo
+        else:
+            null_basis.append(combo)
+
+    remaining, particular = objective, 0
+    while remaining:
+        pivot = remaining.bit_length() - 1
+        if pivot not in basis:
+            return None
+        pivot_vec, pivot_combo = basis[pivot]
+        remaining ^= pivot_vec
+        particular ^= pivot_combo
+    return particular, null_basis
+
+def get_min_presses_mitm(objective, buttons):
+    """Find the minimum presses by meeting in the middle over two halves of the buttons."""
+    half = len(buttons) // 2
+    left_presses = {}
+    for k in range(half + 1):
+        for combo in combinations(buttons[:half], k):
+            left_presses.setdefault(reduce(lambda x, y: x ^ y, combo, 0), k)
+    min_presses = None
+    for k in range(len(buttons) - half + 1):
+        if min_presses is not None and k >= min_presses:
+            break
+        for combo in combinations(buttons[half:], k):
+            needed = objective ^ reduce(lambda x, y: x ^ y, combo, 0)
+            if needed in left_presses and (min_presses is None or left_presses[needed] + k < min_presses):
+                min_presses = left_presses[needed] + k
+    return min_presses
+
+def get_min_presses_gf2(objective, buttons):
+    """Find the minimum presses by walking the nullspace of the GF(2) system."""
+    reduced = reduce_gf2_system(objective, buttons)
+    if reduced is None:
+        return None
+    particular, null_basis = reduced
+    # enumerating 2^nullity solutions only pays off while it beats 2^(buttons/2) for meet in the middle
+    if 2 * len(null_basis) > len(buttons):
+        return get_min_presses_mitm(objective, buttons)
+    # gray code order flips one nullspace vector per step
+    presses = particular
+    min_presses = presses.bit_count()
+    for step in range(1, 2 ** len(null_basis)):
+        presses ^= null_basis[(step & -step).bit_length() - 1]
+        min_presses = min(min_presses, presses.bit_count())
+    return min_presses
+
+class MachineStore:
+    """Packed NumPy storage for every machine's lights, button masks and joltages."""
+    __slots__ = ('objectives', 'buttons', 'button_offsets', 'joltages', 'joltage_offsets')
+
+    def __init__(self, parsed_data):
+        self.objectives = np.array([entry['objective'] for entry in parsed_data], dtype=np.uint64)
+        self.buttons = np.array([b for entry in parsed_data for b in entry['buttons']], dtype=np.uint64)
+        self.button_offsets = np.cumsum([0] + [len(entry['buttons']) for entry in parsed_data])
+        self.joltages = np.array([j for entry in parsed_data for j in entry['joltages']], dtype=np.int64)
+        self.joltage_offsets = np.cumsum([0] + [len(entry['joltages']) for entry in parsed_data])
+
+    def __len__(self):
+        return len(self.objectives)
+
+    def get_buttons(self, i):
+        """Return the button masks of machine i as a uint64 view."""
+        return self.buttons[self.button_offsets[i]:self.button_offsets[i + 1]]
+
+    def get_joltages(self, i):
+        """Return the joltage targets of machine i as an int64 view."""
+        return self.joltages[self.joltage_offsets[i]:self.joltage_offsets[i + 1]]
+
+def get_min_presses_vectorized(objective, buttons, block_bits=20):
+    """Find the minimum presses exactly by evaluating every XOR combination in bulk."""
+    low, high = buttons[:block_bits], buttons[block_bits:]
+    # reflecting the table for each button lays out all low combinations in gray code order
+    xors = np.zeros(1, dtype=np.uint64)
+    counts = np.zeros(1, dtype=np.uint8)
+    for button in low:
+        xors = np.concatenate((xors, xors[::-1] ^ button))
+        counts = np.concatenate((counts, counts[::-1] + 1))
+
+    # walk any remaining buttons in gray code order, one table comparison per step
+    min_presses = None
+    high_xor, high_pressed = np.uint64(0), 0
+    for step in range(2 ** len(high)):
+        if step:
+            flip = (step & -step).bit_length() - 1
+            high_xor ^= high[flip]
+            high_pressed ^= 1 << flip
+        hits = counts[xors == (np.uint64(objective) ^ high_xor)]
+        if hits.size:
+            presses = int(hits.min()) + high_pressed.bit_count()
+            if min_presses is None or presses < min_presses:
+                min_presses = presses
+    return min_presses
+
+def get_part1_baseline_solution(machine_store):
+    """Exact brute-force Part 1 over the packed machine store, for cross-checking the GF(2) solver."""
+    return sum(get_min_presses_vectorized(machine_store.objectives[i], machine_store.get_buttons(i))
+               for i in range(len(machine_store)))
+
+def get_part1_solution(parsed_data, workers=1, timeout=None):
     """Complete Part 1 solution here"""
-    total_min_presses = 0
-    for entry in parsed_data:
-        objective = entry['objective']
-        buttons = entry['buttons']
-        min_presses = None
-        for buttons_pressed in range(1, len(buttons) + 1):
-            # get each combination of presses for num_presses
-            if min_presses is None:
-                for combo in combinations(buttons, buttons_pressed):
-                    combo_xor = reduce(lambda x, y: x ^ y, combo, 0)
-                    if combo_xor == objective:
-                        logger.debug(msg=f"for button {objective} found minimum {buttons_pressed} with combo {combo}")
-                        min_presses = buttons_pressed
-                        break
-        total_min_presses += min_presses
-    return total_min_presses
+    return sum(solve_machines(parsed_data, part=1, workers=workers, timeout=timeout))
 
 def get_binary_from_int(value):
     """Convert an integer to its binary representation."""
     return bin(value)[2:]
 
-def convert_to_different_numeric_base(value, base=10):
-    """Convert a binary number to a different base."""
-    bits = [int(x) for x in list(bin(value)[2:])]
-    bits.reverse()
-    return sum([base ** i * v for i, v in enumerate(bits)])
-
-## BFS version, too slow   
-# def get_part2_solution(parsed_data):
-#     """Complete Part 2 solution here"""
-#     total_min_presses = 0
-#     for i, entry in enumerate(parsed_data):
-#         buttons = entry['buttons']
-#         joltages = entry['joltages']
-#         # continue to treat offset as sort of bitmask for easier computation
-#         # each place has more possible values than just 1 or 0, but we can still use the same logic
-#         # to compute the minimum number of presses required
-#         numeric_base = max(joltages)
-#         target_joltage = sum([numeric_base ** i * v for i, v in enumerate(joltages)])
-#         buttons = [convert_to_different_numeric_base(b, numeric_base) for b in buttons]
-#         next_values = list(buttons)
-#         min_presses = {b: 1 for b in buttons}
-#         current_presses = 1
-#         while target_joltage not in min_presses:
-#             current_values = list(next_values)
-#             next_values = []
-#             for v in current_values:
-#                 for b in buttons:
-#                     next_v = v + b
-#                     if next_v not in min_presses and next_v <= target_joltage:
-#                         min_presses[next_v] = current_presses + 1
-#                         next_values.append(next_v)
-#             current_presses += 1
-
-#         logger.debug(msg=f"entry {i} :: target {target_joltage} :: min_presses {min_presses[target_joltage]}")
-#         total_min_presses += min_presses[target_joltage]
-#     return total_min_presses
-
-def dfs(remaining, min_presses, buttons):
-    """Depth-first search to find the minimum number of presses required."""
-    if remaining == 0:
-        return 0
-    if remaining < 0:
-        return float('inf')
-    if remaining in min_presses:
-        return min_presses[remaining]
-
-    min_count = float('inf')
-    for b in buttons:
-        if remaining % b == 0:
-            count = dfs(remaining // b, min_presses, buttons) * remaining // b
-        count = dfs(remaining - b, min_presses, buttons)
-        if count != float('inf'):
-            min_count = min(min_count, count + 1)
-    min_presses[remaining] = min_count
-    return min_count
-
-def get_part2_solution(parsed_data):
+def reduce_joltage_system(buttons, joltages):
+    """Reduce the button/joltage system over the rationals to integer pivot rows and free buttons."""
+    num_buttons = len(buttons)
+    # one row per joltage counter: which buttons bump it, augmented with its target
+    rows = [[Fraction((b >> i) & 1) for b in buttons] + [Fraction(t)] for i, t in enumerate(joltages)]
+    pivots = []
+    r = 0
+    for col in range(num_buttons):
+        pivot_row = next((k for k in range(r, len(rows)) if rows[k][col] != 0), None)
+        if pivot_row is None:
+            continue
+        rows[r], rows[pivot_row] = rows[pivot_row], rows[r]
+        scale = rows[r][col]
+        rows[r] = [v / scale for v in rows[r]]
+        for k, row in enumerate(rows):
+            if k != r and row[col] != 0:
+                factor = row[col]
+                rows[k] = [v - factor * p for v, p in zip(row, rows[r])]
+        pivots.append(col)
+        r += 1
+    if any(row[-1] != 0 for row in rows[r:]):
+        return None
+    free = [col for col in range(num_buttons) if col not in pivots]
+
+    # scale each pivot row to integers: denom * x_pivot = rhs - sum(coef * x_free)
+    pivot_rows = []
+    for row in rows[:r]:
+        denom = math.lcm(*(v.denominator for v in row))
+        pivot_rows.append((denom, int(row[-1] * denom), [int(row[f] * denom) for f in free]))
+    return pivot_rows, free
+
+def get_min_joltage_presses(buttons, joltages):
+    """Find the fewest button presses reaching the joltage targets by branch and bound over free buttons."""
+    reduced = reduce_joltage_system(buttons, joltages)
+    if reduced is None:
+        return None
+    pivot_rows, free = reduced
+    # a button can never be pressed more often than the smallest counter it bumps
+    bounds = [min((t for i, t in enumerate(joltages) if (buttons[f] >> i) & 1), default=0) for f in free]
+
+    # scaled by a common denominator the total presses are affine in the free presses
+    common = math.lcm(*(denom for denom, _, _ in pivot_rows))
+    base_total = sum(common // denom * rhs for denom, rhs, _ in pivot_rows)
+    weights = [common - sum(common // denom * coefs[k] for denom, _, coefs in pivot_rows) for k in range(len(free))]
+    # most optimistic contribution of the still unassigned free buttons, to the total and to each pivot
+    total_slack = [0] * (len(free) + 1)
+    row_slack = [[0] * (len(free) + 1) for _ in pivot_rows]
+    for k in reversed(range(len(free))):
+        total_slack[k] = total_slack[k + 1] + min(0, weights[k] * bounds[k])
+        for r, (_, _, coefs) in enumerate(pivot_rows):
+            row_slack[r][k] = row_slack[r][k + 1] + min(0, coefs[k] * bounds[k])
+
+    best = None
+
+    def search(k, assigned, scaled_total, residuals):
+        nonlocal best
+        if best is not None and scaled_total + total_slack[k] >= best * common:
+            return False
+        if any(res - slack[k] < 0 for res, slack in zip(residuals, row_slack)):
+            return False
+        if k == len(free):
+            total = 0
+            for (denom, _, _), res in zip(pivot_rows, residuals):
+                presses, rem = divmod(res, denom)
+                if rem:
+                    return False
+                total += presses
+            total += sum(assigned)
+            if best is None or total < best:
+                best = total
+            return True
+        lo, hi = 0, bounds[k]
+        if k == len(free) - 1:
+            # every pivot must stay non-negative, which clips the last free button to an interval
+            for res, (_, _, coefs) in zip(residuals, pivot_rows):
+                if coefs[k] > 0:
+                    hi = min(hi, res // coefs[k])
+                elif coefs[k] < 0:
+                    lo = max(lo, -(res // -coefs[k]))
+        # try the cheaper end of the range first so the incumbent tightens quickly
+        values = range(hi, lo - 1, -1) if weights[k] < 0 else range(lo, hi + 1)
+        for value in values:
+            found = search(k + 1, assigned + [value], scaled_total + weights[k] * value,
+                           [res - coefs[k] * value for res, (_, _, coefs) in zip(residuals, pivot_rows)])
+            # the total is linear in the last free button, so the first feasible value is its best
+            if found and k == len(free) - 1:
+                break
+        return False
+
+    search(0, [], base_total, [rhs for _, rhs, _ in pivot_rows])
+    return best
+
+def get_machine_key(entry):
+    """Return a content hash identifying a machine by its lights, buttons and joltages."""
+    text = f"{entry['objective']}|{','.join(map(str, entry['buttons']))}|{','.join(map(str, entry['joltages']))}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def solve_machine(part, entry):
+    """Return the minimum presses for a single machine for the given part."""
+    if part == 1:
+        return get_min_presses_gf2(entry['objective'], entry['buttons'])
+    return get_min_joltage_presses(entry['buttons'], entry['joltages'])
+
+def raise_machine_timeout(signum, frame):
+    """Signal handler: abort the machine currently being solved in this worker."""
+    raise TimeoutError
+
+def solve_machine_within_budget(task):
+    """Worker: solve one machine, returning its key, whether it beat its own wall-clock budget, and its presses."""
+    part, key, entry, timeout = task
+    if timeout is None:
+        return key, True, solve_machine(part, entry)
+    # the budget starts when this worker picks the machine up, not when it was queued
+    signal.signal(signal.SIGALRM, raise_machine_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return key, True, solve_machine(part, entry)
+    except TimeoutError:
+        # None already means an infeasible machine, so a timeout is flagged separately
+        return key, False, None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+def solve_machines(parsed_data, part, workers=1, timeout=None):
+    """Solve every machine for the given part, reusing cached results and fanning misses out to a process pool.
+
+    Machines that run past the per-machine timeout are left uncached and raise TimeoutError once the rest are cached.
+    """
+    keys = [get_machine_key(entry) for entry in parsed_data]
+    # identical machines are only solved once, whether repeated in this input or seen in an earlier one
+    pending = {}
+    for key, entry in zip(keys, parsed_data):
+        if (part, key) not in MACHINE_CACHE and key not in pending:
+            pending[key] = entry
+    logger.debug(msg=f"Part {part}: {len(parsed_data) - len(pending)} of {len(parsed_data)} machines cached")
+
+    timed_out = []
+    if workers > 1 or timeout is not None:
+        tasks = [(part, key, entry, timeout) for key, entry in pending.items()]
+        with multiprocessing.Pool(processes=max(workers, 1)) as pool:
+            results = pool.imap_unordered(solve_machine_within_budget, tasks)
+            for done, (key, finished, presses) in enumerate(results, 1):
+                if not finished:
+                    timed_out.append(key)
+                    logger.error(msg=f"Part {part}: machine {key[:12]} timed out after {timeout}s")
+                else:
+                    MACHINE_CACHE[(part, key)] = presses
+                if done == len(tasks) or done % max(len(tasks) // 10, 1) == 0:
+                    logger.info(msg=f"Part {part}: processed {done}/{len(tasks)} machines")
+        if timed_out:
+            unsolved = ', '.join(key[:12] for key in timed_out)
+            raise TimeoutError(f"Part {part}: {len(timed_out)} machines did not finish within {timeout}s: {unsolved}")
+    else:
+        for key, entry in pending.items():
+            MACHINE_CACHE[(part, key)] = solve_machine(part, entry)
+
+    min_presses = [MACHINE_CACHE[(part, key)] for key in keys]
+    for i, presses in enumerate(min_presses):
+        logger.debug(msg=f"entry {i} :: part {part} :: min_presses {presses}")
+    return min_presses
+
+def get_part2_solution(parsed_data, workers=1, timeout=None):
     """Complete Part 2 solution here"""
-    total_min_presses = 0
-    for i, entry in enumerate(parsed_data):
-        buttons = entry['buttons']
-        joltages = entry['joltages']
-        # continue to treat offset as sort of bitmask for easier computation
-        # each place has more possible values than just 1 or 0, but we can still use the same logic
-        # to compute the minimum number of presses required
-        numeric_base = max(joltages)
-        target_joltage = sum([numeric_base ** i * v for i, v in enumerate(joltages)])
-        buttons = [convert_to_different_numeric_base(b, numeric_base) for b in buttons]
-        min_presses = {}
-        min_presses[target_joltage] = dfs(target_joltage, min_presses, buttons)
-        logger.debug(msg=f"entry {i} :: target {target_joltage} :: min_presses {min_presses[target_joltage]}")
-        total_min_presses += min_presses[target_joltage]
-    return total_min_presses
+    return sum(solve_machines(parsed_data, part=2, workers=workers, timeout=timeout))
 
 def print_answer(answer, part=1):
     """Print the answer in a standard format."""
@@ -1,7 +1,13 @@
 """Python test file for unit testing in support of AoC solves"""
 import os
+import time
 import pytest
 from .solution import parse_data, get_file_data, get_part1_solution, get_part2_solution
+from .solution import reduce_gf2_system, get_min_presses_gf2, get_min_presses_mitm
+from .solution import reduce_joltage_system, get_min_joltage_presses
+from .solution import MACHINE_CACHE, get_machine_key, solve_machines, solve_machine
+from . import solution
+from .solution import MachineStore, get_min_presses_vectorized, get_part1_baseline_solution
 
 
 @pytest.fixture(name="test_data")
@@ -50,3 +56,116 @@ def test_all(test_data):
     data = parse_data(test_data)
     assert get_part1_solution(data) == 7
     assert get_part2_solution(data) == 33
+
+
+def test_gf2_solver(test_data):
+    """Test the GF(2) nullspace search and meet-in-the-middle fallback
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    expected = [2, 3, 2]
+    for entry, presses in zip(data, expected):
+        assert get_min_presses_gf2(entry['objective'], entry['buttons']) == presses
+        assert get_min_presses_mitm(entry['objective'], entry['buttons']) == presses
+    assert reduce_gf2_system(0b100, [0b001, 0b010, 0b011]) is None
+    assert reduce_gf2_system(0b011, [0b001, 0b010, 0b011]) == (0b011, [0b111])
+
+
+def test_joltage_solver(test_data):
+    """Test the rational elimination and branch and bound joltage solver
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    expected = [10, 12, 11]
+    for entry, presses in zip(data, expected):
+        assert get_min_joltage_presses(entry['buttons'], entry['joltages']) == presses
+    # a counter no button reaches cannot be satisfied
+    assert reduce_joltage_system([0b01], [1, 1]) is None
+    assert get_min_joltage_presses([0b01, 0b10, 0b11], [2, 3]) == 3
+
+
+def test_parallel_machines(test_data):
+    """Test process pool machine solving and the content-hash cache
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    MACHINE_CACHE.clear()
+    assert get_part1_solution(data, workers=2) == 7
+    assert get_part2_solution(data, workers=2, timeout=30) == 33
+    assert len(MACHINE_CACHE) == 6
+    # a repeated machine definition hits the cache instead of being solved again
+    assert get_machine_key(data[0]) == get_machine_key(parse_data(test_data)[0])
+    assert solve_machines(data + data[:1], part=2) == [10, 12, 11, 10]
+    assert len(MACHINE_CACHE) == 6
+
+
+def test_machine_store(test_data):
+    """Test the packed machine store and vectorized XOR baseline
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    store = MachineStore(data)
+    assert len(store) == 3
+    assert store.get_buttons(0).tolist() == data[0]['buttons']
+    assert store.get_joltages(2).tolist() == data[2]['joltages']
+    assert get_part1_baseline_solution(store) == get_part1_solution(data)
+    # splitting the buttons across the table and the outer gray code walk gives the same answer
+    assert get_min_presses_vectorized(store.objectives[1], store.get_buttons(1), block_bits=2) == 3
+
+
+def test_machine_timeout(test_data, monkeypatch):
+    """Test that a slow machine only loses its own budget and its timeout reaches the caller
+
+    Args:
+        test_data (str): takes in a raw text str object as a data blob
+    """
+    data = parse_data(test_data)
+    MACHINE_CACHE.clear()
+    slow_key = get_machine_key(data[0])
+
+    def slow_solve_machine(part, entry):
+        if get_machine_key(entry) == slow_key:
+            time.sleep(30)
+        return solve_machine(part, entry)
+
+    monkeypatch.setattr(solution, "solve_machine", slow_solve_machine)
+    start = time.perf_counter()
+    # one worker runs the machines back to back; the fast ones still get their own full budget
+    with pytest.raises(TimeoutError, match=slow_key[:12]):
+        solve_machines(data, part=2, workers=1, timeout=1)
+    assert time.perf_counter() - start < 10
+    # the fast machines are cached before the timeout is raised, and no partial total is returned
+    assert len(MACHINE_CACHE) == 2
+    with pytest.raises(TimeoutError):
+        get_part2_solution(data, timeout=1)
+    monkeypatch.undo()
+    assert get_part2_solution(data, timeout=30) == 33
+
+
+def test_infeasible_machine(monkeypatch):
+    """Test that a machine with no solution is cached as None by both the pool and the serial paths"""
+    data = parse_data("[.#] (0) {1,1}")
+    MACHINE_CACHE.clear()
+    assert solve_machines(data, part=1, workers=2) == [None]
+    assert solve_machines(data, part=2, timeout=30) == [None]
+    assert len(MACHINE_CACHE) == 2
+
+    def unexpected_solve_machine(part, entry):
+        raise AssertionError("cached machine solved again")
+
+    # the serial path runs in this process, so a second solve would hit the patched solver
+    monkeypatch.setattr(solution, "solve_machine", unexpected_solve_machine)
+    assert solve_machines(data, part=1) == [None]
+    assert solve_machines(data, part=2) == [None]
+    monkeypatch.undo()
+    MACHINE_CACHE.clear()
+    assert solve_machines(data, part=1) == [None]
+    assert len(MACHINE_CACHE) == 1